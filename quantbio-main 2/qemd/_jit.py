@@ -0,0 +1,16 @@
+# qemd/_jit.py
+# Optional Numba JIT. Without numba installed the decorated functions run
+# as plain Python, so the package still works (just slower).
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover
+    prange = range
+
+    def njit(*args, **kwargs):
+        # Support both bare @njit and @njit(cache=True, ...)
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
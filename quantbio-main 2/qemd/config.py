@@ -5,6 +5,7 @@ import numpy as np
 NUM_ETC_SITES = 7   # 7-node ETC model
 TIME_END = 500.0    # ps (total evolution time) - Increased from 50.0 to allow transport
 DT = 0.05           # ps (time step)
+TRAJECTORY_DTYPE = np.complex64  # ρ(t) storage; metrics accumulate in float64
 
 # --- Decoherence (Gamma) Sweep Range for ENAQT Curve ---
 GAMMA_MIN = 0.005   # /ps
@@ -25,3 +26,7 @@ J_BETA = 0.3        # z-score → J scale
 GAMMA_LAM = 0.4     # redox z → γ scale
 J_MIN_CLIP = 0.02
 J_MAX_CLIP = 0.08
+
+# --- Propagator Cache ---
+CACHE_DECIMALS = 12  # parameter rounding for liouvillian_eig cache keys
+CACHE_SIZE = 128     # LRU entries
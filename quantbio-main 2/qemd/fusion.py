@@ -1,7 +1,9 @@
 # qemd/fusion.py
+import math
 import numpy as np
+from scipy.special import expit
 from sklearn.linear_model import LogisticRegression
-from sklearn.preprocessing import minmax_scale
+from ._jit import njit
 
 # Heuristic weights for static fusion
 W1_ETE = 1.0
@@ -28,13 +30,27 @@ def fit_qhs_model(features, labels):
     clf.fit(features, labels)
     return clf
 
+def precompile_qhs(clf):
+    """
+    Snapshot a trained binary QHS model as (w, b) so scoring skips
+    sklearn's per-call validation and dispatch.
+    """
+    w = np.array(clf.coef_[0], dtype=float)
+    b = float(clf.intercept_[0])
+    return w, b
+
 def compute_qhs(clf, features):
     """
     Predict QHS using trained model.
+    clf is a fitted model or its precompile_qhs (w, b) snapshot.
     Returns probabilities of class 1 (Healthy).
     """
-    return clf.predict_proba(features)[:, 1]
+    if isinstance(clf, LogisticRegression):
+        clf = precompile_qhs(clf)
+    w, b = clf
+    return expit(np.asarray(features, dtype=float) @ w + b)
 
+@njit(cache=True, fastmath=True)
 def fuse_qhs_static(ete, tau_norm, gamma_norm, R,
              w1=W1_ETE, w2=W2_TAU_C, w3=W3_GAMMA_STAR, w4=W4_RESILIENCE, b=BIAS):
     """
@@ -42,9 +58,22 @@ def fuse_qhs_static(ete, tau_norm, gamma_norm, R,
     QHS = sigmoid(w1*ETE + w2*tau + w3*gamma + w4*R + b)
     """
     z = w1*ete + w2*tau_norm + w3*gamma_norm + w4*R + b
-    qhs = 1.0 / (1.0 + np.exp(-z))
+    qhs = 1.0 / (1.0 + math.exp(-z))
     return float(qhs)
 
+def fuse_qhs_batch(ete, tau_norm, gamma_norm, R,
+             w1=W1_ETE, w2=W2_TAU_C, w3=W3_GAMMA_STAR, w4=W4_RESILIENCE, b=BIAS):
+    """
+    fuse_qhs_static over whole cohorts (or jitter replicates) at once.
+    Inputs are broadcast arrays; returns an ndarray of QHS values.
+    """
+    z = (w1 * np.asarray(ete, dtype=float)
+         + w2 * np.asarray(tau_norm, dtype=float)
+         + w3 * np.asarray(gamma_norm, dtype=float)
+         + w4 * np.asarray(R, dtype=float)
+         + b)
+    return expit(z)
+
 def normalize_metrics(cohort_metrics):
     """
     Min-max normalize tau_c and gamma* across cohort.
@@ -53,26 +82,35 @@ def normalize_metrics(cohort_metrics):
     if not cohort_metrics:
         return []
 
-    tau_c_values = np.array([m['tau_c'] for m in cohort_metrics], dtype=float)
-    gamma_star_values = np.array([m['gamma_star'] for m in cohort_metrics], dtype=float)
+    n = len(cohort_metrics)
+
+    def _column(key):
+        return np.fromiter((m[key] for m in cohort_metrics), dtype=float, count=n)
 
     # Safe min-max
     def _safe_minmax(v):
         if v.size == 0: return v
         if np.allclose(v, v[0]): return np.zeros_like(v)
-        return minmax_scale(v, feature_range=(0, 1))
+        lo = v.min()
+        return (v - lo) / (v.max() - lo)
 
-    tau_c_norm = _safe_minmax(tau_c_values)
-    gamma_star_norm = _safe_minmax(gamma_star_values)
+    ete_peak = np.clip(_column("ETE_peak"), 0.0, 1.0)
+    tau_c_norm = np.clip(_safe_minmax(_column("tau_c")), 0.0, 1.0)
+    gamma_star_norm = np.clip(_safe_minmax(_column("gamma_star")), 0.0, 1.0)
+    resilience = np.clip(_column("resilience"), 0.0, 1.0)
 
     normalized = []
-    for i, m in enumerate(cohort_metrics):
+    for m, e, t, g, r in zip(cohort_metrics, ete_peak.tolist(), tau_c_norm.tolist(),
+                             gamma_star_norm.tolist(), resilience.tolist()):
         normalized.append({
             "sample_id": m["sample_id"],
-            "ETE_peak": float(np.clip(m["ETE_peak"], 0.0, 1.0)),
-            "tau_c_norm": float(np.clip(tau_c_norm[i], 0.0, 1.0)),
-            "gamma_star_norm": float(np.clip(gamma_star_norm[i], 0.0, 1.0)),
-            "resilience": float(np.clip(m["resilience"], 0.0, 1.0)),
+            "ETE_peak": e,
+            "tau_c_norm": t,
+            "gamma_star_norm": g,
+            "resilience": r,
         })
 
     return normalized
+
+# Pay the JIT compile (or cache load) cost once at import
+fuse_qhs_static(0.0, 0.0, 0.0, 0.0)
@@ -6,14 +6,35 @@ from .config import (
     J_MIN_CLIP, J_MAX_CLIP,
     K_SINK, K_LOSS
 )
+from ._jit import njit
+
+@njit(cache=True, fastmath=True)
+def _mean_affine(z_vec, offset, scale):
+    """
+    offset + scale * mean(z_vec), as a straight loop for Numba.
+    """
+    total = 0.0
+    for z in z_vec:
+        total += z
+    return offset + scale * (total / len(z_vec))
+
+@njit(cache=True, fastmath=True)
+def _scaled_clip(base, beta, z, lo, hi):
+    """
+    clip(base * (1 + beta * z), lo, hi) without NumPy dispatch.
+    Config constants are passed in rather than read as globals so the
+    on-disk Numba cache never goes stale when config.py changes.
+    """
+    x = base * (1.0 + beta * z)
+    return min(max(x, lo), hi)
 
 def map_expression_to_epsilon(expr_vec_z, eps0=0.0):
     """
     Maps mean z-scored gene expression to site energy (epsilon).
     epsilon = eps0 + EPS_ALPHA * z_mean
     """
-    z = float(np.mean(expr_vec_z))
-    epsilon = eps0 + EPS_ALPHA * z
+    z_vec = np.asarray(expr_vec_z, dtype=float).ravel()
+    epsilon = _mean_affine(z_vec, float(eps0), EPS_ALPHA)
     return float(epsilon)
 
 def map_supercomplex_to_J(edge_expr_z):
@@ -22,16 +43,16 @@ def map_supercomplex_to_J(edge_expr_z):
     J = J_BASE * (1 + J_BETA * z)
     """
     z = float(edge_expr_z)
-    J = J_BASE * (1.0 + J_BETA * z)
-    return float(np.clip(J, J_MIN_CLIP, J_MAX_CLIP))
+    J = _scaled_clip(J_BASE, J_BETA, z, J_MIN_CLIP, J_MAX_CLIP)
+    return float(J)
 
 def map_redox_to_gamma(redox_z):
     """
     Maps redox/hypoxia/ROS z-score to decoherence rate gamma.
     """
     z = float(redox_z)
-    gamma = GAMMA_MID * (1.0 + GAMMA_LAM * z)
-    return float(np.clip(gamma, GAMMA_MIN, GAMMA_MAX))
+    gamma = _scaled_clip(GAMMA_MID, GAMMA_LAM, z, GAMMA_MIN, GAMMA_MAX)
+    return float(gamma)
 
 def get_sink_loss_params():
     """
@@ -48,26 +69,19 @@ def get_params_for_sample(omics_data):
       - 'ci_z', 'ciii_z', 'civ_z'
       - 'ci_ciii_z', 'ciii_civ_z'
       - 'redox_z'
+
+    'epsilon' and 'J' are returned as float ndarrays.
     """
 
-    epsilon = [
-        map_expression_to_epsilon(omics_data['ci_z']),
-        map_expression_to_epsilon(omics_data['ci_z']),
-        map_expression_to_epsilon(omics_data['ci_z']),
-        map_expression_to_epsilon(omics_data['ciii_z']),
-        map_expression_to_epsilon(omics_data['ciii_z']),
-        map_expression_to_epsilon(omics_data['ciii_z']),
-        map_expression_to_epsilon(omics_data['civ_z']),
-    ]
+    # One mapping per complex / supercomplex edge, broadcast over its sites
+    eps_ci = map_expression_to_epsilon(omics_data['ci_z'])
+    eps_ciii = map_expression_to_epsilon(omics_data['ciii_z'])
+    eps_civ = map_expression_to_epsilon(omics_data['civ_z'])
+    epsilon = np.array([eps_ci] * 3 + [eps_ciii] * 3 + [eps_civ])
 
-    J = [
-        map_supercomplex_to_J(omics_data['ci_ciii_z']),   # J_01
-        map_supercomplex_to_J(omics_data['ci_ciii_z']),   # J_12
-        map_supercomplex_to_J(omics_data['ci_ciii_z']),   # J_23
-        map_supercomplex_to_J(omics_data['ciii_civ_z']),  # J_34
-        map_supercomplex_to_J(omics_data['ciii_civ_z']),  # J_45
-        map_supercomplex_to_J(omics_data['ciii_civ_z']),  # J_56
-    ]
+    J_ci_ciii = map_supercomplex_to_J(omics_data['ci_ciii_z'])    # J_01, J_12, J_23
+    J_ciii_civ = map_supercomplex_to_J(omics_data['ciii_civ_z'])  # J_34, J_45, J_56
+    J = np.array([J_ci_ciii] * 3 + [J_ciii_civ] * 3)
 
     gamma = map_redox_to_gamma(omics_data['redox_z'])
     k_sink, k_loss = get_sink_loss_params()
@@ -79,3 +93,7 @@ def get_params_for_sample(omics_data):
         "k_sink": k_sink,
         "k_loss": k_loss
     }
+
+# Pay the JIT compile (or cache load) cost once at import
+map_expression_to_epsilon(0.0)
+map_supercomplex_to_J(0.0)